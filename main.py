@@ -13,13 +13,17 @@ os.environ["QT_LOGGING_RULES"] = "qt.multimedia.ffmpeg=false"
 
 from PySide6.QtWidgets import QApplication
 
+from src.nexback.core.audio import AudioManager
 from src.nexback.ui.main_window import MainWindow
 
 
 def main() -> None:
     """Initialize and run the application."""
     app = QApplication(sys.argv)
-    window = MainWindow()
+
+    # The window moves the audio manager to its audio thread and preloads there
+    audio_manager = AudioManager()
+    window = MainWindow(audio_manager)
     window.show()
     sys.exit(app.exec())
 
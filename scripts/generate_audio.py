@@ -1,20 +1,26 @@
 """
 This script generates audio files for the letters in AUDIO_POOL using edge-tts.
-I used this script to generate .mp3 audios,
-and I manaully converted them to .opus using FFmpeg for better performance in the app,
-which is not included in this script.
+The TTS audio is piped straight into FFmpeg, which writes the files the app
+actually uses, so no manual conversion step is needed anymore. FFmpeg must
+be available on PATH.
+
+Two files are written per letter:
+    .wav  - 16-bit PCM, loaded directly by the app without any decoder
+    .opus - compact fallback, decoded through Qt's FFmpeg backend
 U can use it as a reference or modify it as needed.
 
-Here's the FFmpeg command I used for conversion:
-    -c:a libopus ^
-    -ar 24000 ^
-    -ac 1 ^
-    -b:a 32k ^
-    -vbr on ^
-    -compression_level 10 ^
+These are the FFmpeg options used for the .opus conversion
+(the .wav uses the same sample rate and channel count):
+    -c:a libopus
+    -ar 24000
+    -ac 1
+    -b:a 32k
+    -vbr on
+    -compression_level 10
 """
 
 import asyncio
+import contextlib
 import os
 
 import edge_tts
@@ -23,24 +29,85 @@ AUDIO_POOL = "ABCHKLQR"
 OUTPUT_DIR = "resources/audio"
 VOICE = "en-US-JennyNeural"  # Clear female voice
 
+FFMPEG_OPUS_ARGS = (
+    "-c:a", "libopus",
+    "-ar", "24000",
+    "-ac", "1",
+    "-b:a", "32k",
+    "-vbr", "on",
+    "-compression_level", "10",
+)  # fmt: skip
+
+FFMPEG_WAV_ARGS = (
+    "-c:a", "pcm_s16le",
+    "-ar", "24000",
+    "-ac", "1",
+)  # fmt: skip
+
+# Limit concurrent requests to stay clear of edge-tts rate limits
+MAX_CONCURRENT_REQUESTS = 4
+
+
+async def generate_char(char, semaphore):
+    # Single letters are usually read as letters (e.g. "A" rather than the article "a"),
+    # so the character is sent as-is.
+    opus_file = os.path.join(OUTPUT_DIR, f"{char}.opus")
+    wav_file = os.path.join(OUTPUT_DIR, f"{char}.wav")
+
+    async with semaphore:
+        ffmpeg = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "mp3", "-i", "pipe:0",
+            *FFMPEG_OPUS_ARGS, opus_file,
+            *FFMPEG_WAV_ARGS, wav_file,
+            stdin=asyncio.subprocess.PIPE,
+        )  # fmt: skip
+        stdin = ffmpeg.stdin
+        assert stdin is not None  # requested with stdin=PIPE
+
+        try:
+            # Stream the TTS audio (MP3) into FFmpeg as it arrives
+            communicate = edge_tts.Communicate(char, VOICE)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    stdin.write(chunk["data"])
+                    await stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # FFmpeg exited early; its exit status is reported below
+            pass
+        except BaseException:
+            # Don't leave FFmpeg waiting for input that will never come
+            with contextlib.suppress(ProcessLookupError):
+                ffmpeg.kill()
+            raise
+        finally:
+            stdin.close()
+            returncode = await ffmpeg.wait()
+
+        if returncode != 0:
+            raise RuntimeError(f"FFmpeg failed to encode {opus_file} / {wav_file}")
+
+    print(f"Generated {opus_file} and {wav_file}")
+
 
 async def generate_audio():
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
+    await asyncio.to_thread(os.makedirs, OUTPUT_DIR, exist_ok=True)
 
     print(f"Generating audio files in {OUTPUT_DIR} using voice {VOICE}...")
 
-    for char in AUDIO_POOL:
-        text = char
-        # Add some pause or specific pronunciation if needed, but single letter usually works fine.
-        # Sometimes "A" might be read as "a" (article) vs "A" (letter).
-        # To ensure letter pronunciation, we might need to tweak, but let's try direct first.
-        # For "A", "H", etc. usually fine.
-
-        output_file = os.path.join(OUTPUT_DIR, f"{char}.mp3")
-        communicate = edge_tts.Communicate(text, VOICE)
-        await communicate.save(output_file)
-        print(f"Generated {output_file}")
+    # Requests are network-bound, so run them concurrently
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    # Let every letter finish rather than cancelling the rest on the first
+    # failure: cancelling a task while its FFmpeg process is being spawned
+    # can leave asyncio waiting for it forever
+    results = await asyncio.gather(
+        *(generate_char(char, semaphore) for char in AUDIO_POOL),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise ExceptionGroup("Some audio files could not be generated", errors)
 
 
 if __name__ == "__main__":
@@ -9,6 +9,13 @@ Modules:
     utils: Utility functions and configuration
 """
 
-from . import core, ui, utils
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import core, ui, utils
 
 __all__ = ["core", "ui", "utils"]
+
+__getattr__ = lazy_submodules(__name__, __all__)
@@ -0,0 +1,29 @@
+"""Lazy submodule loading shared by the NexBack packages."""
+
+import importlib
+from collections.abc import Callable, Iterable
+from types import ModuleType
+
+
+def lazy_submodules(package: str, names: Iterable[str]) -> Callable[[str], ModuleType]:
+    """Build a module-level __getattr__ that imports submodules on first access.
+
+    Assign the result to __getattr__ in a package's __init__ (PEP 562).
+    Importing a submodule also binds it on the package, so this is only
+    called once per submodule.
+
+    Args:
+        package: Name of the package, i.e. its __name__.
+        names: Submodules that may be imported this way.
+
+    Returns:
+        The __getattr__ function for the package.
+    """
+    submodules = frozenset(names)
+
+    def __getattr__(name: str) -> ModuleType:
+        if name in submodules:
+            return importlib.import_module(f".{name}", package)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
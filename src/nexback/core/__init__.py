@@ -6,6 +6,13 @@ Modules:
     storage: Session data persistence
 """
 
-from . import engine, audio, storage
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import audio, engine, storage
 
 __all__ = ["engine", "audio", "storage"]
+
+__getattr__ = lazy_submodules(__name__, __all__)
@@ -1,36 +1,145 @@
 """Audio playback management for N-Back stimuli.
 
-This module handles playback of pre-recorded audio files (Opus format)
-for audio stimuli in the Dual N-Back training task.
+This module handles playback of pre-recorded audio files for audio stimuli
+in the Dual N-Back training task. Each file is loaded once into raw PCM and
+kept in memory, so playing a stimulus involves no file I/O or decoding.
+
+16-bit PCM .wav files are preferred and read with the standard library, so
+QAudioDecoder is only used when a stimulus falls back to its .opus file.
 """
 
 import os
+import wave
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import QUrl
-from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+from PySide6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+    Slot,
+)
+from PySide6.QtMultimedia import (
+    QAudioDecoder,
+    QAudioFormat,
+    QAudioSink,
+    QMediaDevices,
+)
+
+
+class _PreloadSignals(QObject):
+    """Signals used by the preload worker to report back to the GUI thread."""
+
+    # audio character -> raw PCM frames, audio character -> encoded file contents
+    loaded = Signal(dict, dict)
+
+
+class _PreloadWorker(QRunnable):
+    """Reads the stimulus files on a thread-pool thread."""
+
+    def __init__(
+        self, audio_dir: Path, chars: str, sample_rate: int, channel_count: int
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            audio_dir: Directory containing audio files.
+            chars: Audio characters whose files should be read.
+            sample_rate: Sample rate a .wav file must have to be used as-is.
+            channel_count: Channel count a .wav file must have to be used as-is.
+        """
+        super().__init__()
+        self.audio_dir = audio_dir
+        self.chars = chars
+        self.sample_rate = sample_rate
+        self.channel_count = channel_count
+        self.signals = _PreloadSignals()
+
+    def run(self) -> None:
+        """Read every available file and emit the contents keyed by character."""
+        pcm: dict[str, bytes] = {}
+        encoded: dict[str, bytes] = {}
+        for char in self.chars:
+            frames = self._read_wav(self.audio_dir / f"{char}.wav")
+            if frames is not None:
+                pcm[char] = frames
+                continue
+
+            file_path = self.audio_dir / f"{char}.opus"
+            try:
+                encoded[char] = file_path.read_bytes()
+            except OSError:
+                print(f"Warning: Audio file not found for '{char}' at {file_path}")
 
+        self.signals.loaded.emit(pcm, encoded)
 
-class AudioManager:
+    def _read_wav(self, file_path: Path) -> bytes | None:
+        """Read the PCM frames of a .wav file in the playback format.
+
+        Args:
+            file_path: Path of the .wav file.
+
+        Returns:
+            The raw frames, or None if the file is missing or in another format.
+        """
+        try:
+            with wave.open(str(file_path), "rb") as wav:
+                if (
+                    wav.getsampwidth() != 2
+                    or wav.getframerate() != self.sample_rate
+                    or wav.getnchannels() != self.channel_count
+                ):
+                    print(f"Warning: Unexpected format in {file_path}, ignoring it")
+                    return None
+                return wav.readframes(wav.getnframes())
+        except (OSError, EOFError, wave.Error):
+            return None
+
+
+class AudioManager(QObject):
     """Manages audio playback for training stimuli.
 
-    Uses Qt's QMediaPlayer to play pre-recorded audio files in Opus format.
+    Loads the pre-recorded .wav files (or, failing that, decodes the .opus
+    files with QAudioDecoder) once and plays the resulting PCM buffers. Each
+    character gets its own QAudioSink, so starting one clip never cuts off
+    another that is still playing.
+
+    Loading is started with preload_async(): files are read on a thread-pool
+    thread and any Opus fallbacks are decoded asynchronously, so construction
+    does not block the UI.
+
+    All audio objects are children of the manager, so it can be moved to a
+    dedicated thread with moveToThread() before preloading; preload_async()
+    and play() are slots that can then be invoked through queued signals.
+
+    Signals:
+        ready: Emitted once every stimulus file has been loaded (or skipped).
     """
 
+    ready = Signal()
+
     # Audio characters available for training
     AUDIO_POOL = "ABCHKLQR"
 
-    def __init__(self, audio_dir: str | Path | None = None) -> None:
+    # PCM playback format (matches the 16-bit 24 kHz mono assets)
+    SAMPLE_RATE = 24000
+    CHANNEL_COUNT = 1
+
+    def __init__(
+        self, audio_dir: str | Path | None = None, parent: QObject | None = None
+    ) -> None:
         """Initialize the audio manager.
 
         Args:
             audio_dir: Directory containing audio files. If None, defaults to
                       'resources/audio' in the current working directory.
+            parent: Parent object, if any.
         """
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(1.0)
+        super().__init__(parent)
 
         # Set audio directory
         if audio_dir is None:
@@ -39,20 +148,155 @@ class AudioManager:
 
         self.audio_dir = Path(audio_dir)
 
+        self._format = QAudioFormat()
+        self._format.setSampleRate(self.SAMPLE_RATE)
+        self._format.setChannelCount(self.CHANNEL_COUNT)
+        self._format.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+
+        # Decoded PCM buffers and their output sinks keyed by audio character
+        self._buffers: dict[str, QBuffer] = {}
+        self._sinks: dict[str, QAudioSink] = {}
+
+        # In-flight decoders, their encoded sources and accumulated PCM chunks
+        self._decoders: dict[str, QAudioDecoder] = {}
+        self._sources: dict[str, QBuffer] = {}
+        self._chunks: dict[str, list[bytes]] = {}
+
+        self._worker: _PreloadWorker | None = None
+        self._is_ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether preloading has completed."""
+        return self._is_ready
+
+    @Slot()
+    def preload_async(self) -> None:
+        """Start loading all stimulus files in the background.
+
+        Emits ready when done. Calling this again while loading is in
+        progress or after it has completed has no effect.
+        """
+        if self._worker is not None or self._is_ready:
+            return
+
+        self._worker = _PreloadWorker(
+            self.audio_dir, self.AUDIO_POOL, self.SAMPLE_RATE, self.CHANNEL_COUNT
+        )
+        self._worker.signals.loaded.connect(self._on_files_loaded)
+        QThreadPool.globalInstance().start(self._worker)
+
+    @Slot(dict, dict)
+    def _on_files_loaded(
+        self, pcm: dict[str, bytes], encoded: dict[str, bytes]
+    ) -> None:
+        """Store the PCM read by the preload worker and decode any fallbacks.
+
+        Args:
+            pcm: Raw PCM frames keyed by audio character.
+            encoded: Encoded .opus contents keyed by audio character.
+        """
+        for char, data in pcm.items():
+            self._store_pcm(char, data)
+
+        for char, data in encoded.items():
+            source = QBuffer(self)
+            source.setData(QByteArray(data))
+            source.open(QIODevice.OpenModeFlag.ReadOnly)
+
+            decoder = QAudioDecoder(self)
+            decoder.setAudioFormat(self._format)
+            decoder.setSourceDevice(source)
+            decoder.bufferReady.connect(partial(self._on_buffer_ready, char))
+            decoder.finished.connect(partial(self._on_decode_finished, char))
+            decoder.error.connect(partial(self._on_decode_error, char))
+
+            self._sources[char] = source
+            self._decoders[char] = decoder
+            self._chunks[char] = []
+            decoder.start()
+
+        self._check_ready()
+
+    def _on_buffer_ready(self, char: str) -> None:
+        """Collect a decoded PCM chunk for a character.
+
+        Args:
+            char: Audio character whose decoder produced the buffer.
+        """
+        buffer = self._decoders[char].read()
+        if buffer.isValid():
+            self._chunks[char].append(bytes(buffer.constData()))
+
+    def _on_decode_finished(self, char: str) -> None:
+        """Store the fully decoded PCM for a character.
+
+        Args:
+            char: Audio character whose decoding finished.
+        """
+        decoder = self._decoders.pop(char, None)
+        if decoder is None:
+            return
+        decoder.deleteLater()
+        self._sources.pop(char).deleteLater()
+
+        self._store_pcm(char, b"".join(self._chunks.pop(char)))
+        self._check_ready()
+
+    def _on_decode_error(self, char: str, error: QAudioDecoder.Error) -> None:
+        """Report a decoding failure and discard partial data.
+
+        Args:
+            char: Audio character whose decoding failed.
+            error: Error code reported by the decoder.
+        """
+        decoder = self._decoders.pop(char, None)
+        self._chunks.pop(char, None)
+        if decoder is None:
+            return
+        print(f"Warning: Failed to decode audio for '{char}': {decoder.errorString()}")
+        decoder.deleteLater()
+        self._sources.pop(char).deleteLater()
+
+        self._check_ready()
+
+    def _store_pcm(self, char: str, pcm: bytes) -> None:
+        """Keep the PCM for a character in memory and give it a sink.
+
+        Args:
+            char: Audio character the PCM belongs to.
+            pcm: Raw frames in the playback format.
+        """
+        buffer = QBuffer(self)
+        buffer.setData(QByteArray(pcm))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        self._buffers[char] = buffer
+
+        sink = QAudioSink(QMediaDevices.defaultAudioOutput(), self._format, self)
+        sink.setVolume(1.0)
+        self._sinks[char] = sink
+
+    def _check_ready(self) -> None:
+        """Emit ready once no decoder is left in flight."""
+        if self._is_ready or self._decoders:
+            return
+
+        self._is_ready = True
+        self._worker = None
+        self.ready.emit()
+
+    @Slot(str)
     def play(self, char: str) -> None:
-        """Play audio file for the given character.
+        """Play audio for the given character.
 
         Args:
             char: Audio character to play (e.g., 'A', 'B', 'C').
-
-        Raises:
-            Warning printed if audio file not found for the character.
         """
-        filename = f"{char}.opus"
-        file_path = self.audio_dir / filename
+        sink = self._sinks.get(char)
+        if sink is None:
+            return
 
-        if file_path.exists():
-            self.player.setSource(QUrl.fromLocalFile(str(file_path)))
-            self.player.play()
-        else:
-            print(f"Warning: Audio file not found for '{char}' at {file_path}")
+        buffer = self._buffers[char]
+        sink.stop()
+        buffer.seek(0)
+        sink.start(buffer)
@@ -5,27 +5,77 @@ It manages stimulus generation, response evaluation, scoring, and adaptive diffi
 """
 
 import random
-from enum import Enum, auto
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum, IntEnum, auto
+from typing import ClassVar
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QElapsedTimer, QObject, Qt, QTimer, Signal
 
 from src.nexback.utils.config import GameConfig, ScoringMethod
 
+# Audio characters available for training, indexed by audio pool index
+_AUDIO_POOL = "ABCHKLQR"
+_AUDIO_POOL_SIZE = len(_AUDIO_POOL)
+_GRID_SIZE = 9
 
-class StimulusType(Enum):
-    """Enumeration of stimulus modalities."""
 
-    POSITION = auto()
-    AUDIO = auto()
+class StimulusType(IntEnum):
+    """Enumeration of stimulus modalities.
+
+    Integer-valued so members hash and compare as plain ints and can be used
+    directly as indices.
+    """
+
+    POSITION = 0
+    AUDIO = 1
 
 
-class ResponseType(Enum):
+class ResponseType(IntEnum):
     """Enumeration of response classification types."""
 
-    HIT = auto()  # Correctly identified match
-    MISS = auto()  # Missed a match
-    FALSE_ALARM = auto()  # Claimed match when none existed
-    REJECTION = auto()  # Correctly ignored non-match (implicit)
+    HIT = 0  # Correctly identified match
+    MISS = 1  # Missed a match
+    FALSE_ALARM = 2  # Claimed match when none existed
+    REJECTION = 3  # Correctly ignored non-match (implicit)
+
+
+class TrialPhase(Enum):
+    """Enumeration of the timed phases of a trial."""
+
+    IDLE = auto()  # No session running
+    STIMULUS = auto()  # Stimulus presented, collecting responses
+    FEEDBACK = auto()  # Showing feedback before the next stimulus
+
+
+# Modalities a forced match (any of the three) or interference stimulus (one
+# of the first two) applies to, drawn as plain ints
+_MATCH_POSITION, _MATCH_AUDIO, _MATCH_BOTH = range(3)
+_MATCH_KINDS = 3
+_INTERFERENCE_KINDS = 2
+
+# Column indices into a modality's row of scoring counts, and the matching
+# keys of the dictionary form reported in session results
+_HIT, _MISS, _FALSE_ALARM, _TARGETS = range(4)
+_STAT_KEYS = ("hit", "miss", "false_alarm", "targets")
+
+
+@dataclass(frozen=True, slots=True)
+class TrialOutcome:
+    """Implicit outcomes of one evaluated trial for both modalities.
+
+    Attributes:
+        position: MISS or REJECTION for position, or None if the user responded.
+        audio: MISS or REJECTION for audio, or None if the user responded.
+        position_hits: Position hits so far in the session.
+        audio_hits: Audio hits so far in the session.
+    """
+
+    position: ResponseType | None
+    audio: ResponseType | None
+    position_hits: int
+    audio_hits: int
 
 
 class NBackEngine(QObject):
@@ -36,13 +86,15 @@ class NBackEngine(QObject):
     Signals:
         stimulus_presented: Emitted when a new stimulus is presented (position_index, audio_char).
         feedback_generated: Emitted with feedback for a response (StimulusType, ResponseType).
+        trial_evaluated: Emitted once per finished trial with a TrialOutcome.
         score_updated: Emitted when score changes (current_score, total_possible).
         session_finished: Emitted when session ends with final statistics dict.
         progress_updated: Emitted when progress changes (current_trial, total_trials).
     """
 
     stimulus_presented = Signal(int, str)  # position_index (0-8), audio_char
-    feedback_generated = Signal(StimulusType, ResponseType)
+    feedback_generated = Signal(int, int)  # StimulusType, ResponseType
+    trial_evaluated = Signal(object)  # TrialOutcome
     score_updated = Signal(int, int)  # current_score, total_possible
     session_finished = Signal(dict)  # final stats
     progress_updated = Signal(int, int)  # current, total
@@ -55,45 +107,109 @@ class NBackEngine(QObject):
         """
         super().__init__()
         self.config = config
-        self.history: list[tuple[int, str]] = []  # List of (position, audio) tuples
+
+        # Also report misses/rejections through feedback_generated, one
+        # emission per modality, for consumers of the older signal protocol
+        self.emit_legacy_feedback: bool = False
+
         self.current_trial: int = 0
         self.is_running: bool = False
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._next_trial)
+
+        # Single re-armed timer that drives the trial phase state machine
+        self._phase = TrialPhase.IDLE
+        self._phase_timer = QTimer()
+        self._phase_timer.setSingleShot(True)
+        self._phase_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._phase_timer.timeout.connect(self._on_phase_tick)
+
+        # Timing telemetry: actual minus scheduled duration of each phase (ms)
+        self._phase_clock = QElapsedTimer()
+        self._phase_expected_ms: int = 0
+        self.timing_offsets_ms: list[int] = []
+
+        # time.perf_counter_ns() at each stimulus onset, for aligning with
+        # external recordings
+        self.stimulus_onsets_ns: list[int] = []
 
         # Random Number Generator for reproducible sequences
         self.rng = random.Random(self.config.random_seed)
 
+        # Stimulus sequence for the whole session, generated at session start.
+        # Stored as parallel byte arrays of position and audio pool index.
+        self._hist_pos = bytearray()
+        self._hist_aud = bytearray()
+
+        # Per-trial N-back match flags for each modality, derived from the sequence
+        self._pos_match: bytes = b""
+        self._aud_match: bytes = b""
+
+        # Match flags of the trial on screen, indexed by StimulusType
+        self._trial_match: tuple[int, int] = (0, 0)
+
+        # Config values that are constant within a session
+        self._snapshot_config()
+
+        # Valid trials for scoring (after initial N trials), fixed at session start
+        self._total_valid_trials: int = 0
+
         # Current trial state
         self.current_stimulus: tuple[int, str] | None = None
-        self.user_responses: dict[StimulusType, bool] = {
-            StimulusType.POSITION: False,
-            StimulusType.AUDIO: False,
-        }
-
-        # Scoring statistics by stimulus type
-        self.stats: dict[StimulusType, dict[str, int]] = {
-            StimulusType.POSITION: {
-                "hit": 0,
-                "miss": 0,
-                "false_alarm": 0,
-                "targets": 0,
-            },
-            StimulusType.AUDIO: {"hit": 0, "miss": 0, "false_alarm": 0, "targets": 0},
+        # Whether each modality was answered this trial, indexed by StimulusType
+        self.user_responses: list[bool] = [False, False]
+
+        # Scoring counts, one row per StimulusType indexed by _HIT.._TARGETS
+        self._counts: list[list[int]] = [[0, 0, 0, 0], [0, 0, 0, 0]]
+
+    @property
+    def history(self) -> list[tuple[int, str]]:
+        """Stimuli presented so far in this session as (position, audio) tuples."""
+        return [
+            (self._hist_pos[t], _AUDIO_POOL[self._hist_aud[t]])
+            for t in range(self.current_trial)
+        ]
+
+    @property
+    def stats(self) -> dict[StimulusType, dict[str, int]]:
+        """Scoring statistics by stimulus type.
+
+        Built from the internal counts on access; mutating the returned
+        dictionaries does not affect the engine.
+        """
+        return {
+            stimulus_type: dict(zip(_STAT_KEYS, self._counts[stimulus_type]))
+            for stimulus_type in StimulusType
         }
 
     def start_session(self) -> None:
         """Start a new training session."""
-        self.history = []
         self.current_trial = 0
         self.is_running = True
+        self.timing_offsets_ms = []
+        self.stimulus_onsets_ns = []
+        self._snapshot_config()
+        self._total_valid_trials = max(0, self._total - self._n)
         self._reset_stats()
+        self._pregenerate()
         self._next_trial()
 
+    def _snapshot_config(self) -> None:
+        """Copy the per-session constant config values into attributes.
+
+        The trial loop reads these on every trial; the config itself can only
+        change between sessions (settings dialog, adaptive difficulty).
+        """
+        config = self.config
+        self._n: int = config.n_level
+        self._total: int = config.total_trials
+        self._trial_ms: int = config.trial_duration_ms
+        self._fb_ms: int = config.feedback_duration_ms
+        self._p_match: float = config.match_probability
+        self._p_interf: float = config.interference_probability
+
     def stop_session(self) -> None:
         """Stop the current training session."""
         self.is_running = False
-        self.timer.stop()
+        self._stop_phase()
 
     def submit_response(self, stimulus_type: StimulusType) -> None:
         """Process user response to a stimulus.
@@ -113,17 +229,17 @@ class NBackEngine(QObject):
         # Evaluate response immediately
         is_match = self._check_match(stimulus_type)
         if is_match:
-            self.stats[stimulus_type]["hit"] += 1
+            self._counts[stimulus_type][_HIT] += 1
             self.feedback_generated.emit(stimulus_type, ResponseType.HIT)
+            # The score is the total hit count, so only hits can change it
+            self._emit_score()
         else:
-            self.stats[stimulus_type]["false_alarm"] += 1
+            self._counts[stimulus_type][_FALSE_ALARM] += 1
             self.feedback_generated.emit(stimulus_type, ResponseType.FALSE_ALARM)
 
-        self._emit_score()
-
     def _next_trial(self) -> None:
         """Schedule the next trial, handling feedback display."""
-        if self.current_trial >= self.config.total_trials:
+        if self.current_trial >= self._total:
             self._finish_session()
             return
 
@@ -131,95 +247,140 @@ class NBackEngine(QObject):
         if self.current_trial > 0:
             self._evaluate_misses()
             # Wait for feedback to be shown before presenting next stimulus
-            QTimer.singleShot(self.config.feedback_duration_ms, self._present_stimulus)
+            self._start_phase(TrialPhase.FEEDBACK, self._fb_ms)
         else:
             # First trial, present immediately
             self._present_stimulus()
 
     def _present_stimulus(self) -> None:
-        """Generate and present a new stimulus."""
+        """Present the next pre-generated stimulus."""
         if not self.is_running:
             return
 
-        # Generate new stimulus
-        pos, audio = self._generate_stimulus()
+        t = self.current_trial
+        pos = self._hist_pos[t]
+        audio = _AUDIO_POOL[self._hist_aud[t]]
         self.current_stimulus = (pos, audio)
-        self.history.append(self.current_stimulus)
+        self._trial_match = (self._pos_match[t], self._aud_match[t])
+        self.current_trial += 1
 
         # Reset user response state for new trial
-        self.user_responses = {StimulusType.POSITION: False, StimulusType.AUDIO: False}
+        self.user_responses[StimulusType.POSITION] = False
+        self.user_responses[StimulusType.AUDIO] = False
 
         # Emit signals for UI update
+        self.stimulus_onsets_ns.append(time.perf_counter_ns())
         self.stimulus_presented.emit(pos, audio)
-        self.progress_updated.emit(self.current_trial + 1, self.config.total_trials)
+        self.progress_updated.emit(self.current_trial, self._total)
 
         # Schedule next trial
-        self.current_trial += 1
-        self.timer.start(self.config.trial_duration_ms)
+        self._start_phase(TrialPhase.STIMULUS, self._trial_ms)
 
-    def _generate_stimulus(self) -> tuple[int, str]:
-        """Generate a new stimulus based on N-Back rules.
+    def _start_phase(self, phase: TrialPhase, duration_ms: int) -> None:
+        """Enter a timed phase and arm the phase timer.
 
-        Returns:
-            Tuple of (position_index, audio_character).
+        Args:
+            phase: Phase to enter.
+            duration_ms: Scheduled duration of the phase in milliseconds.
         """
-        n = self.config.n_level
-        force_match = self.rng.random() < self.config.match_probability
-        force_interference = (
-            not force_match and self.rng.random() < self.config.interference_probability
+        self._phase = phase
+        self._phase_expected_ms = duration_ms
+        self._phase_clock.start()
+        self._phase_timer.start(duration_ms)
+
+    def _stop_phase(self) -> None:
+        """Cancel any pending phase and return to idle."""
+        self._phase_timer.stop()
+        self._phase = TrialPhase.IDLE
+
+    def _on_phase_tick(self) -> None:
+        """Advance the state machine when the current phase elapses."""
+        self.timing_offsets_ms.append(
+            self._phase_clock.elapsed() - self._phase_expected_ms
         )
 
-        pos = self.rng.randint(0, 8)
-        audio_pool = "ABCHKLQR"
-        audio = self.rng.choice(audio_pool)
+        if self._phase == TrialPhase.STIMULUS:
+            self._next_trial()
+        elif self._phase == TrialPhase.FEEDBACK:
+            self._present_stimulus()
+
+    def _pregenerate(self) -> None:
+        """Generate the stimulus sequence for the whole session up front.
+
+        Drawing every stimulus before the first trial keeps random number
+        generation off the per-trial timer callback and makes the sequence
+        depend only on the RNG state, not on UI timing.
+        """
+        total = self._total
+        self._hist_pos = bytearray(total)
+        self._hist_aud = bytearray(total)
+        for t in range(total):
+            self._hist_pos[t], self._hist_aud[t] = self._generate_stimulus(t)
+
+        # Resolve every trial's match status once so responses and miss
+        # evaluation only need a lookup
+        n = self._n
+        pos, aud = self._hist_pos, self._hist_aud
+        self._pos_match = bytes(t >= n and pos[t] == pos[t - n] for t in range(total))
+        self._aud_match = bytes(t >= n and aud[t] == aud[t - n] for t in range(total))
+
+    def _generate_stimulus(self, t: int) -> tuple[int, int]:
+        """Generate the stimulus for trial t based on N-Back rules.
+
+        Args:
+            t: Index of the trial being generated; trials before it are final.
+
+        Returns:
+            Tuple of (position_index, audio_index).
+        """
+        n = self._n
+        force_match = self.rng.random() < self._p_match
+        force_interference = not force_match and self.rng.random() < self._p_interf
+
+        pos = self.rng.randint(0, _GRID_SIZE - 1)
+        audio = self.rng.randrange(_AUDIO_POOL_SIZE)
 
         # Generate match or interference if enough history
-        if len(self.history) >= n:
+        if t >= n:
             if force_match:
-                self._apply_match(pos, audio, n, audio_pool)
+                pos, audio = self._apply_match(pos, audio, t, n)
             elif force_interference:
-                self._apply_interference(pos, audio, n, audio_pool)
+                pos, audio = self._apply_interference(pos, audio, t, n)
 
         return pos, audio
 
-    def _apply_match(
-        self, pos: int, audio: str, n: int, audio_pool: str
-    ) -> tuple[int, str]:
+    def _apply_match(self, pos: int, audio: int, t: int, n: int) -> tuple[int, int]:
         """Apply N-Back match to current stimulus.
 
         Args:
             pos: Current position value.
-            audio: Current audio character.
+            audio: Current audio index.
+            t: Index of the trial being generated.
             n: N-Back level.
-            audio_pool: Available audio characters.
 
         Returns:
             Modified (position, audio) tuple.
         """
         # Decide which modality to match (or both)
-        match_type = self.rng.choice(
-            [StimulusType.POSITION, StimulusType.AUDIO, "BOTH"]
-        )
-
-        target_pos, target_audio = self.history[-n]
+        match_type = self.rng.randrange(_MATCH_KINDS)
 
-        if match_type == StimulusType.POSITION or match_type == "BOTH":
-            pos = target_pos
-        if match_type == StimulusType.AUDIO or match_type == "BOTH":
-            audio = target_audio
+        if match_type != _MATCH_AUDIO:
+            pos = self._hist_pos[t - n]
+        if match_type != _MATCH_POSITION:
+            audio = self._hist_aud[t - n]
 
         return pos, audio
 
     def _apply_interference(
-        self, pos: int, audio: str, n: int, audio_pool: str
-    ) -> tuple[int, str]:
+        self, pos: int, audio: int, t: int, n: int
+    ) -> tuple[int, int]:
         """Apply interference stimulus (N-1 or N+1).
 
         Args:
             pos: Current position value.
-            audio: Current audio character.
+            audio: Current audio index.
+            t: Index of the trial being generated.
             n: N-Back level.
-            audio_pool: Available audio characters.
 
         Returns:
             Modified (position, audio) tuple.
@@ -227,36 +388,46 @@ class NBackEngine(QObject):
         offsets: list[int] = []
         if n > 1:
             offsets.append(n - 1)
-        if len(self.history) >= n + 1:
+        if t >= n + 1:
             offsets.append(n + 1)
 
         if not offsets:
             return pos, audio
 
         interference_n: int = self.rng.choice(offsets)
-        target_pos: int
-        target_audio: str
-        target_pos, target_audio = self.history[-interference_n]
-        interference_type = self.rng.choice([StimulusType.POSITION, StimulusType.AUDIO])
+        interference_type = self.rng.randrange(_INTERFERENCE_KINDS)
 
-        if interference_type == StimulusType.POSITION:
-            pos = target_pos
+        if interference_type == _MATCH_POSITION:
+            pos = self._hist_pos[t - interference_n]
             # Ensure it's NOT a match for N-level
-            if pos == self.history[-n][0]:
-                candidates = [p for p in range(9) if p != self.history[-n][0]]
-                if candidates:
-                    pos = self.rng.choice(candidates)
+            target_pos = self._hist_pos[t - n]
+            if pos == target_pos:
+                pos = self._randrange_excluding(_GRID_SIZE, target_pos)
 
-        elif interference_type == StimulusType.AUDIO:
-            audio = target_audio
+        else:
+            audio = self._hist_aud[t - interference_n]
             # Ensure it's NOT a match for N-level
-            if audio == self.history[-n][1]:
-                candidates = [c for c in audio_pool if c != self.history[-n][1]]
-                if candidates:
-                    audio = self.rng.choice(candidates)
+            target_audio = self._hist_aud[t - n]
+            if audio == target_audio:
+                audio = self._randrange_excluding(_AUDIO_POOL_SIZE, target_audio)
 
         return pos, audio
 
+    def _randrange_excluding(self, stop: int, excluded: int) -> int:
+        """Draw uniformly from range(stop) without the excluded value.
+
+        Args:
+            stop: Exclusive upper bound of the range.
+            excluded: Value in the range that must not be drawn.
+
+        Returns:
+            The drawn value.
+        """
+        # Skip over the excluded value so draws map onto the remaining values
+        # in ascending order
+        value = self.rng.randrange(stop - 1)
+        return value + (value >= excluded)
+
     def _check_match(self, stimulus_type: StimulusType) -> bool:
         """Check if current stimulus matches the N-back stimulus.
 
@@ -266,86 +437,80 @@ class NBackEngine(QObject):
         Returns:
             True if current matches N-back stimulus, False otherwise.
         """
-        n = self.config.n_level
-        if len(self.history) <= n:
+        if self.current_trial == 0:
             return False
 
-        current = self.history[-1]
-        target = self.history[-(n + 1)]
-
-        if stimulus_type == StimulusType.POSITION:
-            return current[0] == target[0]
-        elif stimulus_type == StimulusType.AUDIO:
-            return current[1] == target[1]
-        return False
+        return bool(self._trial_match[stimulus_type])
 
     def _evaluate_misses(self) -> None:
-        """Evaluate the previous trial for misses and correct rejections."""
-        if not self.history:
+        """Evaluate the previous trial for misses and correct rejections.
+
+        Both modalities are resolved first and reported with a single
+        trial_evaluated emission.
+        """
+        if self.current_trial == 0:
             return
 
-        last_stim_idx = len(self.history) - 1
-        n = self.config.n_level
+        pos_match, aud_match = self._trial_match
+        pos_outcome = self._evaluate_modality(StimulusType.POSITION, pos_match)
+        audio_outcome = self._evaluate_modality(StimulusType.AUDIO, aud_match)
+
+        if self.emit_legacy_feedback:
+            if pos_outcome is not None:
+                self.feedback_generated.emit(StimulusType.POSITION, pos_outcome)
+            if audio_outcome is not None:
+                self.feedback_generated.emit(StimulusType.AUDIO, audio_outcome)
+
+        self.trial_evaluated.emit(
+            TrialOutcome(
+                position=pos_outcome,
+                audio=audio_outcome,
+                position_hits=self._counts[StimulusType.POSITION][_HIT],
+                audio_hits=self._counts[StimulusType.AUDIO][_HIT],
+            )
+        )
 
-        last_pos, last_audio = self.history[-1]
+    def _evaluate_modality(
+        self, stimulus_type: StimulusType, is_match: int
+    ) -> ResponseType | None:
+        """Classify the implicit outcome of one modality of the previous trial.
 
-        # Determine if there was a match for each modality
-        pos_match = False
-        audio_match = False
+        Args:
+            stimulus_type: The stimulus modality to evaluate.
+            is_match: Whether the trial was an N-back match for this modality.
 
-        if last_stim_idx >= n:
-            target_pos, target_audio = self.history[-(1 + n)]
-            pos_match = last_pos == target_pos
-            audio_match = last_audio == target_audio
+        Returns:
+            MISS or REJECTION, or None if the user responded (that response
+            was already reported by submit_response).
+        """
+        counts = self._counts[stimulus_type]
+        if is_match:
+            counts[_TARGETS] += 1
 
-        # Evaluate Position modality
-        if pos_match:
-            self.stats[StimulusType.POSITION]["targets"] += 1
-            if not self.user_responses[StimulusType.POSITION]:
-                self.stats[StimulusType.POSITION]["miss"] += 1
-                self.feedback_generated.emit(StimulusType.POSITION, ResponseType.MISS)
-        else:
-            if not self.user_responses[StimulusType.POSITION]:
-                self.feedback_generated.emit(
-                    StimulusType.POSITION, ResponseType.REJECTION
-                )
-
-        # Evaluate Audio modality
-        if audio_match:
-            self.stats[StimulusType.AUDIO]["targets"] += 1
-            if not self.user_responses[StimulusType.AUDIO]:
-                self.stats[StimulusType.AUDIO]["miss"] += 1
-                self.feedback_generated.emit(StimulusType.AUDIO, ResponseType.MISS)
-        else:
-            if not self.user_responses[StimulusType.AUDIO]:
-                self.feedback_generated.emit(StimulusType.AUDIO, ResponseType.REJECTION)
+        if self.user_responses[stimulus_type]:
+            return None
 
-        self._emit_score()
+        if is_match:
+            counts[_MISS] += 1
+            return ResponseType.MISS
+        return ResponseType.REJECTION
 
     def _reset_stats(self) -> None:
         """Reset scoring statistics to initial state."""
-        self.stats = {
-            StimulusType.POSITION: {
-                "hit": 0,
-                "miss": 0,
-                "false_alarm": 0,
-                "targets": 0,
-            },
-            StimulusType.AUDIO: {"hit": 0, "miss": 0, "false_alarm": 0, "targets": 0},
-        }
+        self._counts = [[0, 0, 0, 0], [0, 0, 0, 0]]
 
     def _emit_score(self) -> None:
         """Emit current score update signal."""
+        counts = self._counts
         total_hits = (
-            self.stats[StimulusType.POSITION]["hit"]
-            + self.stats[StimulusType.AUDIO]["hit"]
+            counts[StimulusType.POSITION][_HIT] + counts[StimulusType.AUDIO][_HIT]
         )
         self.score_updated.emit(total_hits, 0)
 
     def _finish_session(self) -> None:
         """Finish the session, evaluate performance, and emit results."""
         self.is_running = False
-        self.timer.stop()
+        self._stop_phase()
         self._evaluate_misses()
 
         # Calculate final score
@@ -381,27 +546,21 @@ class NBackEngine(QObject):
         Returns:
             Final score as a float between 0.0 and 1.0.
         """
-        pos_stats = self.stats[StimulusType.POSITION]
-        audio_stats = self.stats[StimulusType.AUDIO]
-
-        # Valid trials for scoring (after initial N trials)
-        total_valid_trials = max(0, self.config.total_trials - self.config.n_level)
-
-        if self.config.scoring_method == ScoringMethod.STANDARD:
-            return self._calculate_standard_score(
-                pos_stats, audio_stats, total_valid_trials
-            )
-        elif self.config.scoring_method == ScoringMethod.CLINICAL:
-            return self._calculate_clinical_score(
-                pos_stats, audio_stats, total_valid_trials
-            )
-
-        return 0.0
+        scorer = self._SCORERS.get(self.config.scoring_method)
+        if scorer is None:
+            return 0.0
+
+        return scorer(
+            self,
+            self._counts[StimulusType.POSITION],
+            self._counts[StimulusType.AUDIO],
+            self._total_valid_trials,
+        )
 
     def _calculate_standard_score(
         self,
-        pos_stats: dict[str, int],
-        audio_stats: dict[str, int],
+        pos_stats: list[int],
+        audio_stats: list[int],
         total_valid_trials: int,
     ) -> float:
         """Calculate score using standard N-Back scoring method.
@@ -409,26 +568,21 @@ class NBackEngine(QObject):
         Score = True Positives / (True Positives + False Positives + False Negatives)
 
         Args:
-            pos_stats: Position modality statistics.
-            audio_stats: Audio modality statistics.
+            pos_stats: Position modality scoring counts.
+            audio_stats: Audio modality scoring counts.
             total_valid_trials: Number of valid trials for scoring.
 
         Returns:
             Average score across modalities.
         """
-
-        def calc_standard(stats: dict[str, int]) -> float:
-            denom = stats["hit"] + stats["false_alarm"] + stats["miss"]
-            return stats["hit"] / denom if denom > 0 else 0.0
-
-        pos_score = calc_standard(pos_stats)
-        audio_score = calc_standard(audio_stats)
+        pos_score = _standard_modality_score(pos_stats)
+        audio_score = _standard_modality_score(audio_stats)
         return (pos_score + audio_score) / 2.0
 
     def _calculate_clinical_score(
         self,
-        pos_stats: dict[str, int],
-        audio_stats: dict[str, int],
+        pos_stats: list[int],
+        audio_stats: list[int],
         total_valid_trials: int,
     ) -> float:
         """Calculate score using clinical N-Back scoring method.
@@ -437,30 +591,58 @@ class NBackEngine(QObject):
         Final Score = Min(Position Score, Audio Score)
 
         Args:
-            pos_stats: Position modality statistics.
-            audio_stats: Audio modality statistics.
+            pos_stats: Position modality scoring counts.
+            audio_stats: Audio modality scoring counts.
             total_valid_trials: Number of valid trials for scoring.
 
         Returns:
             Minimum score across modalities (stricter evaluation).
         """
+        pos_score = _clinical_modality_score(pos_stats, total_valid_trials)
+        audio_score = _clinical_modality_score(audio_stats, total_valid_trials)
+        return min(pos_score, audio_score)
 
-        def calc_clinical(stats: dict[str, int]) -> float:
-            if total_valid_trials == 0:
-                return 0.0
+    # Scoring method dispatch table, called with the engine as first argument
+    _SCORERS: ClassVar[dict[ScoringMethod, Callable[..., float]]] = {
+        ScoringMethod.STANDARD: _calculate_standard_score,
+        ScoringMethod.CLINICAL: _calculate_clinical_score,
+    }
 
-            tp = stats["hit"]
-            fp = stats["false_alarm"]
-            targets = stats["targets"]
 
-            # Trials without match = Total Valid - Targets
-            trials_without_match = total_valid_trials - targets
+def _standard_modality_score(stats: list[int]) -> float:
+    """Score one modality as hits / (hits + false alarms + misses).
 
-            # True Negatives = Trials without match - False Positives
-            tn = max(0, trials_without_match - fp)
+    Args:
+        stats: Scoring counts for a single modality.
 
-            return (tp + tn) / total_valid_trials
+    Returns:
+        Modality score, or 0.0 if there were no scored events.
+    """
+    denom = stats[_HIT] + stats[_FALSE_ALARM] + stats[_MISS]
+    return stats[_HIT] / denom if denom > 0 else 0.0
 
-        pos_score = calc_clinical(pos_stats)
-        audio_score = calc_clinical(audio_stats)
-        return min(pos_score, audio_score)
+
+def _clinical_modality_score(stats: list[int], total_valid_trials: int) -> float:
+    """Score one modality as (true positives + true negatives) / valid trials.
+
+    Args:
+        stats: Scoring counts for a single modality.
+        total_valid_trials: Number of valid trials for scoring.
+
+    Returns:
+        Modality score, or 0.0 if there were no valid trials.
+    """
+    if total_valid_trials == 0:
+        return 0.0
+
+    tp = stats[_HIT]
+    fp = stats[_FALSE_ALARM]
+    targets = stats[_TARGETS]
+
+    # Trials without match = Total Valid - Targets
+    trials_without_match = total_valid_trials - targets
+
+    # True Negatives = Trials without match - False Positives
+    tn = max(0, trials_without_match - fp)
+
+    return (tp + tn) / total_valid_trials
@@ -5,20 +5,70 @@ supporting both standard JSON format and secure binary format for clinical data.
 """
 
 import json
+import os
 import pickle
-from dataclasses import asdict, is_dataclass
-from datetime import datetime
+import struct
+from collections.abc import Iterable
+from dataclasses import asdict, fields, is_dataclass
+from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, cast
 
+# Secure file record header: little-endian unsigned payload length
+_FRAME_HEADER = struct.Struct("<I")
+
+# Errors pickle.load may raise for a damaged or unsupported file
+_UNPICKLING_ERRORS = (
+    pickle.UnpicklingError,
+    EOFError,
+    ValueError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    KeyError,
+    TypeError,
+)
+
+# Signature at the start of the secure file, ahead of the first record
+_SECURE_SIGNATURE = b"NXBKSEC1"
+
+# Types returned unchanged by Storage._make_serializable
+_SCALAR_TYPES = frozenset({int, float, str, bool, type(None)})
+
+
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON using the standard library."""
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+
 
 class Storage:
     """Manages persistent storage of training session results.
 
     Supports:
-    - JSON format for standard session history (human-readable)
-    - Secure binary (pickle) format for clinical mode data
+    - JSON Lines format for standard session history (human-readable)
+    - Secure binary format for clinical mode data, stored as length-prefixed
+      JSON records after a file signature
+
+    History is appended one session per line, so saving does not depend on
+    the size of the existing history. Entries from the older single-document
+    history.json are still read, ahead of the newer ones. The pickled
+    secure_history.bin of older versions is converted to the new secure file
+    the first time a clinical session is saved.
     """
 
     def __init__(self, storage_dir: str | Path = ".data") -> None:
@@ -29,59 +79,157 @@ class Storage:
         """
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.history_file = self.storage_dir / "history.json"
-        self.secure_file = self.storage_dir / "secure_history.bin"
+        self.history_file = self.storage_dir / "history.jsonl"
+        self.legacy_history_file = self.storage_dir / "history.json"
+        self.secure_file = self.storage_dir / "secure_history.dat"
+        self.legacy_secure_file = self.storage_dir / "secure_history.bin"
 
-    def save_session(self, result: dict[str, Any] | Any, config: Any) -> None:
+        # Last converted config: (type and field values it was built from, dictionary)
+        self._config_cache: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+
+    def save_session(
+        self,
+        result: dict[str, Any] | Any,
+        config: Any,
+        timestamp: str | None = None,
+    ) -> None:
         """Save session results to storage.
 
         Args:
             result: Session result dictionary containing stats, score, and level info.
                     Can be a TypedDict or regular dict.
             config: Game configuration object used for the session.
+            timestamp: ISO 8601 timestamp to record for the session. Defaults to
+                       the current UTC time with millisecond precision.
         """
+        self.save_sessions([result], config, [timestamp])
+
+    def save_sessions(
+        self,
+        results: Iterable[dict[str, Any] | Any],
+        config: Any,
+        timestamps: Iterable[str | None] | None = None,
+    ) -> None:
+        """Save several session results played with the same config at once.
+
+        All entries are written with a single open of each storage file, which
+        suits tools that replay or import many sessions.
+
+        Args:
+            results: Session result dictionaries, as passed to save_session.
+            config: Game configuration object used for the sessions.
+            timestamps: ISO 8601 timestamps, one per result. None (or a None
+                        item) records the current UTC time.
+
+        Raises:
+            ValueError: If timestamps and results differ in length.
+        """
+        results = list(results)
+        if timestamps is None:
+            timestamps = [None] * len(results)
+
         # Convert config to dictionary format
         config_dict = self._config_to_dict(config)
 
+        entries = [
+            self._make_entry(result, config_dict, timestamp)
+            for result, timestamp in zip(results, timestamps, strict=True)
+        ]
+        if not entries:
+            return
+
+        # Always save to JSON for user visibility
+        with open(self.history_file, "a+b") as f:
+            # Terminate a last line cut short by an interrupted write, so the
+            # new entries are not glued onto it
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(b"".join(_dumps(entry) + b"\n" for entry in entries))
+
+        # If clinical mode, also save to secure binary file
+        if config_dict.get("is_clinical_mode", False):
+            self._save_secure(entries)
+
+    def _make_entry(
+        self,
+        result: dict[str, Any] | Any,
+        config_dict: dict[str, Any],
+        timestamp: str | None,
+    ) -> dict[str, Any]:
+        """Build the stored entry for one session.
+
+        Args:
+            result: Session result dictionary.
+            config_dict: Serializable configuration dictionary.
+            timestamp: ISO 8601 timestamp, or None for the current UTC time.
+
+        Returns:
+            Session entry with timestamp, config and serializable result.
+        """
         # Make result serializable (convert Enum keys/values)
         serializable_result = self._make_serializable(result)
 
+        if timestamp is None:
+            timestamp = datetime.now(UTC).isoformat(timespec="milliseconds")
+
         # Create session entry with timestamp
-        entry = {
-            "timestamp": datetime.now().isoformat(),
+        return {
+            "timestamp": timestamp,
             "config": config_dict,
             "result": serializable_result,
         }
 
-        # Always save to JSON for user visibility
-        history = self.load_history()
-        history.append(entry)
+    def load_history(self) -> list[dict[str, Any]]:
+        """Load all session history, including the legacy JSON file.
 
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        Lines that cannot be parsed (e.g. a write cut short by a crash) are
+        skipped.
 
-        # If clinical mode, also save to secure binary file
-        if config_dict.get("is_clinical_mode", False):
-            self._save_secure(entry)
+        Returns:
+            List of session entries, or empty list if no history exists.
+        """
+        history = self._load_legacy_history()
 
-    def load_history(self) -> list[dict[str, Any]]:
-        """Load all session history from JSON file.
+        if not self.history_file.exists():
+            return history
+        try:
+            with open(self.history_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        history.append(_loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+        except OSError:
+            pass
+
+        return history
+
+    def _load_legacy_history(self) -> list[dict[str, Any]]:
+        """Load session history written by older versions as one JSON array.
 
         Returns:
-            List of session entries, or empty list if file doesn't exist.
+            List of session entries, or empty list if the file doesn't exist.
         """
-        if not self.history_file.exists():
+        if not self.legacy_history_file.exists():
             return []
         try:
-            with open(self.history_file, encoding="utf-8") as f:
+            with open(self.legacy_history_file, encoding="utf-8") as f:
                 return json.load(f)
         except (OSError, json.JSONDecodeError):
             return []
 
-    @staticmethod
-    def _config_to_dict(config: Any) -> dict[str, Any]:
+    def _config_to_dict(self, config: Any) -> dict[str, Any]:
         """Convert config object to serializable dictionary.
 
+        The same config is usually saved with every session, so the result
+        for a dataclass config is reused for as long as its field values
+        are unchanged. The returned dictionary must not be modified.
+
         Args:
             config: Configuration object (dataclass or regular object).
 
@@ -89,9 +237,18 @@ class Storage:
             Dictionary representation with Enums converted to names.
         """
         if is_dataclass(config) and not isinstance(config, type):
+            values = (
+                type(config),
+                *(getattr(config, field.name) for field in fields(config)),
+            )
+            cache = self._config_cache
+            if cache is not None and cache[0] == values:
+                return cache[1]
+
             config_dict = asdict(config)
+            self._config_cache = (values, config_dict)
         else:
-            config_dict = config.__dict__
+            config_dict = dict(vars(config))
 
         # Convert Enum values to their string names
         for key, value in config_dict.items():
@@ -110,8 +267,10 @@ class Storage:
         Returns:
             Serializable representation (Enums as names, dicts/lists recursively converted).
         """
-        if isinstance(obj, Enum):
-            return obj.name
+        # Plain scalars are by far the most common leaves; return them with a
+        # single type lookup (IntEnum members are not of exact type int)
+        if type(obj) in _SCALAR_TYPES:
+            return obj
         elif isinstance(obj, dict):
             obj_dict = cast(dict[Any, Any], obj)
             return {
@@ -121,25 +280,151 @@ class Storage:
         elif isinstance(obj, list):
             obj_list = cast(list[Any], obj)
             return [Storage._make_serializable(i) for i in obj_list]
+        elif isinstance(obj, Enum):
+            return obj.name
         else:
             return obj
 
-    def _save_secure(self, entry: dict[str, Any]) -> None:
-        """Save session entry to secure binary format (pickle).
+    def load_secure_history(self) -> list[dict[str, Any]]:
+        """Load all session entries from the secure binary file.
+
+        Until the first clinical session is saved by this version, the
+        entries are read from the legacy pickled file instead. Reading stops
+        at the first incomplete or unreadable record.
+
+        Returns:
+            List of session entries, or empty list if the file doesn't exist
+            or lacks the secure file signature.
+        """
+        try:
+            data = self.secure_file.read_bytes()
+        except FileNotFoundError:
+            return self._load_legacy_secure() or []
+        except OSError:
+            return []
+        if not data.startswith(_SECURE_SIGNATURE):
+            return []
+
+        entries: list[dict[str, Any]] = []
+        offset = len(_SECURE_SIGNATURE)
+        header_size = _FRAME_HEADER.size
+        while offset + header_size <= len(data):
+            (length,) = _FRAME_HEADER.unpack_from(data, offset)
+            offset += header_size
+            payload = data[offset : offset + length]
+            if len(payload) < length:
+                break
+            try:
+                entries.append(_loads(payload))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                break
+            offset += length
+
+        return entries
+
+    def _save_secure(self, entries: list[dict[str, Any]]) -> None:
+        """Append session entries to the secure binary file.
 
         Args:
-            entry: Session entry to save securely.
+            entries: Session entries to save securely.
+        """
+        self._migrate_legacy_secure()
+
+        with open(self.secure_file, "a+b") as f:
+            f.seek(0)
+            data = f.read()
+            if _SECURE_SIGNATURE.startswith(data):
+                # New file, or one whose signature was cut short
+                f.truncate(0)
+                f.write(_SECURE_SIGNATURE)
+            elif data.startswith(_SECURE_SIGNATURE):
+                # Drop a last record cut short by an interrupted write, which
+                # would otherwise throw every later record out of alignment
+                f.truncate(self._complete_frames_end(data))
+            f.write(b"".join(self._frame(entry) for entry in entries))
+
+    @staticmethod
+    def _complete_frames_end(data: bytes) -> int:
+        """Find where the last complete record of the secure file ends.
+
+        Args:
+            data: Contents of the secure file, starting with its signature.
+
+        Returns:
+            Offset just past the last record whose payload is complete.
+        """
+        offset = len(_SECURE_SIGNATURE)
+        header_size = _FRAME_HEADER.size
+        while offset + header_size <= len(data):
+            (length,) = _FRAME_HEADER.unpack_from(data, offset)
+            if offset + header_size + length > len(data):
+                break
+            offset += header_size + length
+        return offset
+
+    @staticmethod
+    def _frame(entry: dict[str, Any]) -> bytes:
+        """Encode a session entry as a length-prefixed secure file record.
+
+        Args:
+            entry: Serializable session entry.
+
+        Returns:
+            The record bytes.
+        """
+        payload = _dumps(entry)
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
+    def _load_legacy_secure(self) -> list[dict[str, Any]] | None:
+        """Load the secure file written by older versions (a pickled list).
+
+        The pickle is only ever loaded from this application's own data
+        directory.
+
+        Returns:
+            List of session entries, or None if the file doesn't exist or
+            cannot be read.
+        """
+        try:
+            with open(self.legacy_secure_file, "rb") as f:
+                data = pickle.load(f)
+        except (OSError, *_UNPICKLING_ERRORS):
+            return None
+        return data if isinstance(data, list) else None
+
+    def _migrate_legacy_secure(self) -> None:
+        """Copy the legacy secure entries into a new secure file, once.
+
+        The legacy file is never modified. If it cannot be read, the new
+        file is simply started empty and the legacy file is left in place.
         """
-        data: list[dict[str, Any]] = []
         if self.secure_file.exists():
-            try:
-                with open(self.secure_file, "rb") as f:
-                    data = pickle.load(f)
-            except (OSError, pickle.UnpicklingError):
-                # File corrupted or invalid, start fresh
-                data = []
+            return
 
-        data.append(entry)
+        entries = self._load_legacy_secure()
+        if not entries:
+            return
 
-        with open(self.secure_file, "wb") as f:
-            pickle.dump(data, f)
+        _write_atomic(
+            self.secure_file,
+            _SECURE_SIGNATURE + b"".join(self._frame(entry) for entry in entries),
+        )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace the contents of a file without ever leaving it half-written.
+
+    The data is written to a temporary file next to path, which then
+    replaces it in one step, so a crash leaves either the old or the new
+    contents.
+
+    Args:
+        path: File to write.
+        data: New contents of the file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
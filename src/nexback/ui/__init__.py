@@ -6,6 +6,13 @@ Modules:
     settings_dialog: Configuration settings dialog
 """
 
-from . import grid_widget, main_window, settings_dialog
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import grid_widget, main_window, settings_dialog
 
 __all__ = ["main_window", "grid_widget", "settings_dialog"]
+
+__getattr__ = lazy_submodules(__name__, __all__)
@@ -23,6 +23,16 @@ class GridWidget(QWidget):
     )
     CELL_SIZE = 100
 
+    # (row, column) of each cell in index order
+    CELL_COORDS = tuple((row, col) for row in range(3) for col in range(3))
+
+    # Single stylesheet for the whole grid; cells switch rules through their
+    # "active" dynamic property instead of carrying their own stylesheet
+    GRID_STYLE = (
+        f'QFrame#cell[active="false"] {{ {CELL_INACTIVE_STYLE} }}\n'
+        f'QFrame#cell[active="true"] {{ {CELL_ACTIVE_STYLE} }}'
+    )
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """Initialize the grid widget.
 
@@ -32,18 +42,20 @@ class GridWidget(QWidget):
         super().__init__(parent)
         self._layout = QGridLayout(self)
         self.cells: list[QFrame] = []
+        # Index of the highlighted cell, or None if every cell is inactive
+        self._active_index: int | None = None
         self._init_grid()
 
     def _init_grid(self) -> None:
         """Create and initialize 9 grid cells in 3x3 layout."""
-        for i in range(3):
-            for j in range(3):
-                frame = QFrame()
-                frame.setFrameShape(QFrame.Shape.Box)
-                frame.setStyleSheet(self.CELL_INACTIVE_STYLE)
-                frame.setFixedSize(self.CELL_SIZE, self.CELL_SIZE)
-                self._layout.addWidget(frame, i, j)
-                self.cells.append(frame)
+        self.setStyleSheet(self.GRID_STYLE)
+        for row, col in self.CELL_COORDS:
+            frame = QFrame()
+            frame.setObjectName("cell")
+            frame.setProperty("active", False)
+            frame.setFixedSize(self.CELL_SIZE, self.CELL_SIZE)
+            self._layout.addWidget(frame, row, col)
+            self.cells.append(frame)
 
     def highlight(self, index: int) -> None:
         """Highlight a specific cell by index.
@@ -51,11 +63,35 @@ class GridWidget(QWidget):
         Args:
             index: Cell index (0-8) to highlight.
         """
+        if index == self._active_index:
+            return
+
         self.clear()
         if 0 <= index < len(self.cells):
-            self.cells[index].setStyleSheet(self.CELL_ACTIVE_STYLE)
+            self._set_active(self.cells[index], True)
+            self._active_index = index
 
     def clear(self) -> None:
-        """Reset all cells to inactive state."""
-        for cell in self.cells:
-            cell.setStyleSheet(self.CELL_INACTIVE_STYLE)
+        """Reset all cells to inactive state.
+
+        Only the highlighted cell is restyled; if none is, nothing is done.
+        """
+        if self._active_index is None:
+            return
+
+        self._set_active(self.cells[self._active_index], False)
+        self._active_index = None
+
+    @staticmethod
+    def _set_active(cell: QFrame, active: bool) -> None:
+        """Switch a cell between the active and inactive style rules.
+
+        Args:
+            cell: Cell to update.
+            active: Whether the cell should be shown highlighted.
+        """
+        cell.setProperty("active", active)
+        # Property selectors are only re-evaluated when the cell is repolished
+        style = cell.style()
+        style.unpolish(cell)
+        style.polish(cell)
@@ -4,11 +4,10 @@ This module provides the primary user interface for the training application,
 managing the game flow, user input, and result display.
 """
 
-import random
-from typing import TypedDict
+from typing import TYPE_CHECKING, ClassVar, TypedDict
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QKeyEvent
+from PySide6.QtCore import QCoreApplication, Qt, QThread, QTimer, Signal
+from PySide6.QtGui import QCloseEvent, QKeyEvent
 from PySide6.QtWidgets import (
     QCheckBox,
     QHBoxLayout,
@@ -22,11 +21,17 @@ from PySide6.QtWidgets import (
 )
 
 from src.nexback.core.audio import AudioManager
-from src.nexback.core.engine import NBackEngine, ResponseType, StimulusType
-from src.nexback.core.storage import Storage
+from src.nexback.core.engine import (
+    NBackEngine,
+    ResponseType,
+    StimulusType,
+    TrialOutcome,
+)
 from src.nexback.ui.grid_widget import GridWidget
-from src.nexback.ui.settings_dialog import SettingsDialog
-from src.nexback.utils.config import GameConfig
+from src.nexback.utils.config import GameConfig, ScoringMethod
+
+if TYPE_CHECKING:
+    from src.nexback.core.storage import Storage
 
 
 class StimulusStats(TypedDict):
@@ -68,8 +73,49 @@ class MainWindow(QMainWindow):
     STATUS_INCORRECT_STYLE = "font-size: 16px; font-weight: bold; color: #e74c3c;"
     INSTRUCTIONS_STYLE = "font-size: 14px; color: #888;"
 
-    def __init__(self) -> None:
-        """Initialize the main window and all components."""
+    # Single stylesheet for the status labels; feedback switches rules through
+    # their "state" dynamic property instead of replacing the stylesheet
+    STATUS_STYLE = (
+        f'QLabel[state="waiting"] {{ {STATUS_WAITING_STYLE} }}\n'
+        f'QLabel[state="correct"] {{ {STATUS_CORRECT_STYLE} }}\n'
+        f'QLabel[state="incorrect"] {{ {STATUS_INCORRECT_STYLE} }}'
+    )
+    PROGRESS_STYLE = (
+        "QProgressBar { border: 1px solid #ccc; border-radius: 4px;"
+        " text-align: center; }"
+        " QProgressBar::chunk { background-color: #3498db; }"
+    )
+
+    # Feedback lookup tables, indexed by StimulusType and then by correctness
+    _CORRECT_RESPONSES = frozenset({ResponseType.HIT, ResponseType.REJECTION})
+    _FEEDBACK_TEXTS = (
+        ("Position: Incorrect", "Position: Correct"),
+        ("Audio: Incorrect", "Audio: Correct"),
+    )
+    _FEEDBACK_STATES = ("incorrect", "correct")
+    _WAITING_TEXTS = ("Position: Waiting", "Audio: Waiting")
+    _SCORE_PREFIX = "Score: "
+    _LEVEL_PREFIX = "N-Level: "
+
+    # Requests handled by the audio manager on the audio thread
+    _load_audio = Signal()
+    _play_audio = Signal(str)  # audio_char
+
+    # Response keys and the modality each one answers
+    _KEY_TO_STIM: ClassVar[dict[int, StimulusType]] = {
+        int(Qt.Key.Key_A): StimulusType.POSITION,
+        int(Qt.Key.Key_L): StimulusType.AUDIO,
+    }
+
+    def __init__(self, audio_manager: AudioManager | None = None) -> None:
+        """Initialize the main window and all components.
+
+        Args:
+            audio_manager: Audio manager to play stimuli with. If None, one is
+                created. It must have no parent and must not have started
+                preloading: the window moves it to a dedicated audio thread
+                and starts preloading there.
+        """
         super().__init__()
         self.setWindowTitle("NexBack - Dual N-Back Trainer")
         self.resize(600, 700)
@@ -77,8 +123,11 @@ class MainWindow(QMainWindow):
         # Initialize core components
         self.config = GameConfig()
         self.engine = NBackEngine(self.config)
-        self.storage = Storage()
-        self.audio_manager = AudioManager()
+        # Created on first use, see the storage property
+        self._storage: Storage | None = None
+        if audio_manager is None:
+            audio_manager = AudioManager()
+        self.audio_manager = audio_manager
 
         # UI components - initialized in _init_ui
         self.grid: GridWidget
@@ -96,6 +145,22 @@ class MainWindow(QMainWindow):
         self._init_ui()
         self._connect_signals()
 
+        # Reused single-shot timer that hides the position stimulus
+        self._clear_timer = QTimer(self)
+        self._clear_timer.setSingleShot(True)
+        self._clear_timer.timeout.connect(self.grid.clear)
+
+        self._start_audio_thread()
+
+    @property
+    def storage(self) -> "Storage":
+        """Session storage, created the first time results are saved."""
+        if self._storage is None:
+            from src.nexback.core.storage import Storage
+
+            self._storage = Storage()
+        return self._storage
+
     def _init_ui(self) -> None:
         """Initialize and layout all UI components."""
         central_widget = QWidget()
@@ -104,8 +169,10 @@ class MainWindow(QMainWindow):
 
         # Header with score, level, and clinical mode toggle
         header_layout = QHBoxLayout()
-        self.lbl_level = QLabel(f"N-Level: {self.config.n_level}")
-        self.lbl_score = QLabel("Score: 0")
+        self.lbl_level = QLabel(self._LEVEL_PREFIX + str(self.config.n_level))
+        self.lbl_score = QLabel(self._SCORE_PREFIX + "0")
+        # Score currently shown in lbl_score
+        self._shown_score = 0
         self.chk_clinical = QCheckBox("Clinical Mode")
         self.chk_clinical.toggled.connect(self.on_clinical_toggled)
 
@@ -129,18 +196,25 @@ class MainWindow(QMainWindow):
 
         # Status indicators for each modality
         status_layout = QHBoxLayout()
-        self.lbl_pos_status = QLabel("Position: Waiting")
+        self.lbl_pos_status = QLabel(self._WAITING_TEXTS[StimulusType.POSITION])
         self.lbl_pos_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_pos_status.setStyleSheet(self.STATUS_WAITING_STYLE)
+        self.lbl_pos_status.setProperty("state", "waiting")
+        self.lbl_pos_status.setStyleSheet(self.STATUS_STYLE)
 
-        self.lbl_audio_status = QLabel("Audio: Waiting")
+        self.lbl_audio_status = QLabel(self._WAITING_TEXTS[StimulusType.AUDIO])
         self.lbl_audio_status.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_audio_status.setStyleSheet(self.STATUS_WAITING_STYLE)
+        self.lbl_audio_status.setProperty("state", "waiting")
+        self.lbl_audio_status.setStyleSheet(self.STATUS_STYLE)
 
         status_layout.addWidget(self.lbl_pos_status)
         status_layout.addWidget(self.lbl_audio_status)
         layout.addLayout(status_layout)
 
+        # Status labels indexed by StimulusType, and whether each one still
+        # shows the waiting state
+        self._status_labels = (self.lbl_pos_status, self.lbl_audio_status)
+        self._status_waiting = [True, True]
+
         # Control buttons
         controls_layout = QHBoxLayout()
         self.btn_start = QPushButton("Start Session")
@@ -159,15 +233,71 @@ class MainWindow(QMainWindow):
 
         # Progress bar showing trial progress
         self.progress = QProgressBar()
+        self.progress.setStyleSheet(self.PROGRESS_STYLE)
         layout.addWidget(self.progress)
 
     def _connect_signals(self) -> None:
-        """Connect engine signals to UI update slots."""
-        self.engine.stimulus_presented.connect(self.on_stimulus)
-        self.engine.feedback_generated.connect(self.on_feedback)
-        self.engine.score_updated.connect(self.on_score)
-        self.engine.progress_updated.connect(self.on_progress)
-        self.engine.session_finished.connect(self.on_finished)
+        """Connect engine signals to UI update slots.
+
+        The engine lives in and is driven from the GUI thread, so its signals
+        are connected directly rather than through the thread check of an
+        automatic connection.
+        """
+        direct = Qt.ConnectionType.DirectConnection
+        self.engine.stimulus_presented.connect(self.on_stimulus, direct)
+        self.engine.feedback_generated.connect(self.on_feedback, direct)
+        self.engine.trial_evaluated.connect(self.on_trial_evaluated, direct)
+        self.engine.score_updated.connect(self.on_score, direct)
+        self.engine.progress_updated.connect(self.on_progress, direct)
+        self.engine.session_finished.connect(self.on_finished, direct)
+
+    def _start_audio_thread(self) -> None:
+        """Move the audio manager to its own thread and start preloading there.
+
+        Loading and playback then never block the GUI thread; play requests
+        are delivered to the manager through the queued _play_audio signal.
+        The manager and its audio objects are deleted on that thread once it
+        finishes, which happens when the window closes or the application
+        quits.
+        """
+        self._audio_thread = QThread(self)
+        self._audio_thread.setObjectName("audio")
+        self.audio_manager.moveToThread(self._audio_thread)
+        self._audio_thread.finished.connect(self.audio_manager.deleteLater)
+
+        self._load_audio.connect(self.audio_manager.preload_async)
+        self._play_audio.connect(self.audio_manager.play)
+
+        # Hold the first session back until the stimulus audio is decoded
+        if not self.audio_manager.is_ready:
+            self.btn_start.setEnabled(False)
+            self.audio_manager.ready.connect(self.on_audio_ready)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_audio_thread)
+
+        self._audio_thread.start()
+        self._load_audio.emit()
+
+    def _stop_audio_thread(self) -> None:
+        """Stop the audio thread and wait for it to finish."""
+        self._audio_thread.quit()
+        self._audio_thread.wait()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Stop the audio thread when the window closes.
+
+        Args:
+            event: The close event.
+        """
+        self._stop_audio_thread()
+        super().closeEvent(event)
+
+    def on_audio_ready(self) -> None:
+        """Enable starting a session once stimulus audio has been loaded."""
+        if not self.engine.is_running:
+            self.btn_start.setEnabled(True)
 
     def on_clinical_toggled(self, checked: bool) -> None:
         """Handle clinical mode toggle.
@@ -175,17 +305,21 @@ class MainWindow(QMainWindow):
         Args:
             checked: Whether clinical mode is now enabled.
         """
+        # Never change the mode (and reseed) under a running session
+        if self.engine.is_running:
+            return
+
         self.config.is_clinical_mode = checked
         if checked:
-            self.config.scoring_method = self.config.scoring_method.CLINICAL
+            self.config.scoring_method = ScoringMethod.CLINICAL
             # Fixed seed for reproducibility in clinical mode
             self.config.random_seed = 42
         else:
-            self.config.scoring_method = self.config.scoring_method.STANDARD
+            self.config.scoring_method = ScoringMethod.STANDARD
             self.config.random_seed = None
 
-        # Re-initialize RNG with new seed
-        self.engine.rng = random.Random(self.config.random_seed)
+        # Reseed the engine's RNG in place
+        self.engine.rng.seed(self.config.random_seed)
 
     def keyPressEvent(self, event: QKeyEvent | None) -> None:
         """Handle keyboard input for stimulus responses.
@@ -196,10 +330,9 @@ class MainWindow(QMainWindow):
         if not self.engine.is_running or event is None:
             return
 
-        if event.key() == Qt.Key.Key_A:
-            self.engine.submit_response(StimulusType.POSITION)
-        elif event.key() == Qt.Key.Key_L:
-            self.engine.submit_response(StimulusType.AUDIO)
+        stim_type = self._KEY_TO_STIM.get(event.key())
+        if stim_type is not None:
+            self.engine.submit_response(stim_type)
 
     def start_game(self) -> None:
         """Start a new training session."""
@@ -214,8 +347,11 @@ class MainWindow(QMainWindow):
         self.chk_clinical.setEnabled(False)
 
         # Reset UI state
-        self.lbl_score.setText("Score: 0")
+        self.lbl_score.setText(self._SCORE_PREFIX + "0")
+        self._shown_score = 0
         self._reset_status_labels()
+        # The session length is fixed once the session starts
+        self.progress.setMaximum(self.config.total_trials)
         self.progress.setValue(0)
 
         # Start engine session
@@ -231,11 +367,14 @@ class MainWindow(QMainWindow):
         self.chk_clinical.setEnabled(True)
 
         # Reset UI state
+        self._clear_timer.stop()
         self.grid.clear()
         self._reset_status_labels()
 
     def open_settings(self) -> None:
         """Open the settings dialog to modify configuration."""
+        from src.nexback.ui.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self.config, self)
         if dialog.exec():
             new_settings = dialog.get_settings()
@@ -245,17 +384,38 @@ class MainWindow(QMainWindow):
                 setattr(self.config, key, value)
 
             # Update UI elements that depend on config
-            self.lbl_level.setText(f"N-Level: {self.config.n_level}")
+            self.lbl_level.setText(self._LEVEL_PREFIX + str(self.config.n_level))
 
             # Save configuration (optional, if we want persistence across restarts)
             # self.config.save("config.toml")
 
     def _reset_status_labels(self) -> None:
-        """Reset status labels to 'Waiting' state."""
-        self.lbl_pos_status.setText("Position: Waiting")
-        self.lbl_pos_status.setStyleSheet(self.STATUS_WAITING_STYLE)
-        self.lbl_audio_status.setText("Audio: Waiting")
-        self.lbl_audio_status.setStyleSheet(self.STATUS_WAITING_STYLE)
+        """Reset status labels to 'Waiting' state.
+
+        Labels that have not shown feedback since the last reset are skipped.
+        """
+        waiting = self._status_waiting
+        for stim_type, label in enumerate(self._status_labels):
+            if waiting[stim_type]:
+                continue
+            self._set_status(label, self._WAITING_TEXTS[stim_type], "waiting")
+            waiting[stim_type] = True
+
+    @staticmethod
+    def _set_status(label: QLabel, text: str, state: str) -> None:
+        """Show a status text and switch the label to the matching style rule.
+
+        Args:
+            label: Status label to update.
+            text: Text to display.
+            state: Value of the label's "state" property used by STATUS_STYLE.
+        """
+        label.setText(text)
+        label.setProperty("state", state)
+        # Property selectors are only re-evaluated when the label is repolished
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
 
     def on_stimulus(self, pos: int, audio_char: str) -> None:
         """Handle stimulus presentation.
@@ -270,11 +430,11 @@ class MainWindow(QMainWindow):
         # Display position stimulus
         self.grid.highlight(pos)
 
-        # Play audio stimulus
-        self.audio_manager.play(audio_char)
+        # Play audio stimulus on the audio thread
+        self._play_audio.emit(audio_char)
 
         # Clear visual stimulus after display duration
-        QTimer.singleShot(self.config.stimulus_duration_ms, self.grid.clear)
+        self._clear_timer.start(self.config.stimulus_duration_ms)
 
     def on_feedback(self, stim_type: StimulusType, response_type: ResponseType) -> None:
         """Handle feedback display for a response.
@@ -283,21 +443,26 @@ class MainWindow(QMainWindow):
             stim_type: The stimulus modality (Position or Audio).
             response_type: The response classification (Hit, Miss, False Alarm, or Rejection).
         """
-        is_correct = response_type in [ResponseType.HIT, ResponseType.REJECTION]
-
-        text = "Correct" if is_correct else "Incorrect"
-        style = self.STATUS_CORRECT_STYLE if is_correct else self.STATUS_INCORRECT_STYLE
+        is_correct = response_type in self._CORRECT_RESPONSES
 
         # Update appropriate status label
-        label = (
-            self.lbl_pos_status
-            if stim_type == StimulusType.POSITION
-            else self.lbl_audio_status
+        self._set_status(
+            self._status_labels[stim_type],
+            self._FEEDBACK_TEXTS[stim_type][is_correct],
+            self._FEEDBACK_STATES[is_correct],
         )
-        prefix = "Position" if stim_type == StimulusType.POSITION else "Audio"
+        self._status_waiting[stim_type] = False
 
-        label.setText(f"{prefix}: {text}")
-        label.setStyleSheet(style)
+    def on_trial_evaluated(self, outcome: TrialOutcome) -> None:
+        """Handle the end-of-trial evaluation of both modalities.
+
+        Args:
+            outcome: Implicit outcome of the trial for each modality.
+        """
+        if outcome.position is not None:
+            self.on_feedback(StimulusType.POSITION, outcome.position)
+        if outcome.audio is not None:
+            self.on_feedback(StimulusType.AUDIO, outcome.audio)
 
     def on_score(self, score: int, total: int) -> None:
         """Update score display.
@@ -306,16 +471,21 @@ class MainWindow(QMainWindow):
             score: Current score.
             total: Total possible score (unused but included for future use).
         """
-        self.lbl_score.setText(f"Score: {score}")
+        if score == self._shown_score:
+            return
+
+        self.lbl_score.setText(self._SCORE_PREFIX + str(score))
+        self._shown_score = score
 
     def on_progress(self, current: int, total: int) -> None:
         """Update progress bar.
 
+        The maximum is set once in start_game, so only the value changes here.
+
         Args:
             current: Current trial number.
             total: Total trials in session.
         """
-        self.progress.setMaximum(total)
         self.progress.setValue(current)
 
     def on_finished(self, result: SessionResult) -> None:
@@ -333,32 +503,37 @@ class MainWindow(QMainWindow):
         new_level: int = result["n_level"]
 
         # Format results message
-        pos_stats: StimulusStats = stats[StimulusType.POSITION]
-        audio_stats: StimulusStats = stats[StimulusType.AUDIO]
-
-        msg = "Session Finished!\n\n"
-        msg += f"Final Score: {final_score:.2%}\n"
-
         if promotion:
-            msg += f"Result: PROMOTED to N-Level {new_level}!\n\n"
+            outcome = f"PROMOTED to N-Level {new_level}!"
         elif demotion:
-            msg += f"Result: DEMOTED to N-Level {new_level}...\n\n"
+            outcome = f"DEMOTED to N-Level {new_level}..."
         else:
-            msg += f"Result: Level Maintained at {new_level}\n\n"
-
-        msg += "Position:\n"
-        msg += f"  Hits: {pos_stats['hit']}\n"
-        msg += f"  Misses: {pos_stats['miss']}\n"
-        msg += f"  False Alarms: {pos_stats['false_alarm']}\n\n"
-        msg += "Audio:\n"
-        msg += f"  Hits: {audio_stats['hit']}\n"
-        msg += f"  Misses: {audio_stats['miss']}\n"
-        msg += f"  False Alarms: {audio_stats['false_alarm']}"
+            outcome = f"Level Maintained at {new_level}"
+
+        lines = [
+            "Session Finished!",
+            "",
+            f"Final Score: {final_score:.2%}",
+            f"Result: {outcome}",
+        ]
+        for name, stim_type in (
+            ("Position", StimulusType.POSITION),
+            ("Audio", StimulusType.AUDIO),
+        ):
+            modality: StimulusStats = stats[stim_type]
+            lines += [
+                "",
+                f"{name}:",
+                f"  Hits: {modality['hit']}",
+                f"  Misses: {modality['miss']}",
+                f"  False Alarms: {modality['false_alarm']}",
+            ]
+        msg = "\n".join(lines)
 
         QMessageBox.information(self, "Results", msg)
 
         # Update UI with new level
-        self.lbl_level.setText(f"N-Level: {self.config.n_level}")
+        self.lbl_level.setText(self._LEVEL_PREFIX + str(self.config.n_level))
 
         # Persist session results
         self.storage.save_session(result, self.config)
@@ -5,7 +5,7 @@ parameters for the Dual N-Back training task.
 """
 
 import tomllib
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from enum import Enum, auto
 from pathlib import Path
 
@@ -19,7 +19,7 @@ class ScoringMethod(Enum):
     CLINICAL = auto()  # Stricter clinical scoring (sensitivity/specificity-based)
 
 
-@dataclass
+@dataclass(slots=True)
 class GameConfig:
     """Configuration parameters for the Dual N-Back training game.
 
@@ -68,13 +68,15 @@ class GameConfig:
         Args:
             path: Path to the TOML file.
         """
-        data = asdict(self)
+        # All fields are scalars, so a shallow read avoids asdict's deep copy
+        data = {key: getattr(self, key) for key in _TOML_KEYS}
 
         # Convert Enum to string
         data["scoring_method"] = self.scoring_method.name
 
-        # Remove None values (TOML doesn't support null)
-        data = {k: v for k, v in data.items() if v is not None}
+        # random_seed is the only nullable field (TOML doesn't support null)
+        if data["random_seed"] is None:
+            del data["random_seed"]
 
         with open(path, "wb") as f:
             tomli_w.dump(data, f)
@@ -101,3 +103,7 @@ class GameConfig:
                 data.pop("scoring_method")
 
         return cls(**data)
+
+
+# Field names written to TOML, in declaration order
+_TOML_KEYS = tuple(field.name for field in fields(GameConfig))
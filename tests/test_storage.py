@@ -0,0 +1,106 @@
+"""Tests for session storage in src.nexback.core.storage."""
+
+import pickle
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from src.nexback.core import storage as storage_module
+from src.nexback.core.storage import Storage
+
+TIMESTAMP = "2026-01-01T00:00:00.000+00:00"
+CLINICAL_CONFIG = SimpleNamespace(is_clinical_mode=True)
+
+
+def _result_of_length(length: int) -> dict[str, str]:
+    """Build a session result whose stored record payload is length bytes long."""
+    base = {"timestamp": TIMESTAMP, "config": vars(CLINICAL_CONFIG)}
+    overhead = len(storage_module._dumps({**base, "result": {"note": ""}}))
+    return {"note": "x" * (length - overhead)}
+
+
+class SecureHistoryTest(unittest.TestCase):
+    """Round trips and legacy migration of the secure history file."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.storage = Storage(self._tmp.name)
+
+    def test_first_record_length_low_byte_0x80(self) -> None:
+        # The low byte of these lengths equals the pickle protocol marker
+        for length in (0x80, 0x280, 0x680):
+            with self.subTest(length=length):
+                self.storage.secure_file.unlink(missing_ok=True)
+                first = _result_of_length(length)
+                self.storage.save_session(first, CLINICAL_CONFIG, TIMESTAMP)
+                self.storage.save_session({"note": "second"}, CLINICAL_CONFIG)
+
+                entries = self.storage.load_secure_history()
+
+                self.assertEqual(
+                    [e["result"] for e in entries], [first, {"note": "second"}]
+                )
+
+    def test_legacy_pickle_is_migrated_without_modifying_it(self) -> None:
+        legacy = [{"timestamp": TIMESTAMP, "config": {}, "result": {"score": 1}}]
+        legacy_bytes = pickle.dumps(legacy)
+        self.storage.legacy_secure_file.write_bytes(legacy_bytes)
+
+        self.assertEqual(self.storage.load_secure_history(), legacy)
+        self.assertFalse(self.storage.secure_file.exists())
+
+        self.storage.save_session({"score": 2}, CLINICAL_CONFIG, TIMESTAMP)
+
+        entries = self.storage.load_secure_history()
+        self.assertEqual([e["result"] for e in entries], [{"score": 1}, {"score": 2}])
+        self.assertEqual(self.storage.legacy_secure_file.read_bytes(), legacy_bytes)
+
+    def test_unreadable_legacy_file_is_left_alone(self) -> None:
+        damaged = b"\x80\x06not a pickle"
+        self.storage.legacy_secure_file.write_bytes(damaged)
+
+        self.assertEqual(self.storage.load_secure_history(), [])
+        self.storage.save_session({"score": 3}, CLINICAL_CONFIG, TIMESTAMP)
+
+        entries = self.storage.load_secure_history()
+        self.assertEqual([e["result"] for e in entries], [{"score": 3}])
+        self.assertEqual(self.storage.legacy_secure_file.read_bytes(), damaged)
+
+
+class AppendAfterCrashTest(unittest.TestCase):
+    """Appending to history files whose last record was cut short."""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.storage = Storage(self._tmp.name)
+
+    def test_only_the_torn_session_is_lost(self) -> None:
+        for n in (1, 2):
+            self.storage.save_session({"n": n}, CLINICAL_CONFIG, TIMESTAMP)
+
+        # Simulate a crash in the middle of writing session 2
+        for path in (self.storage.history_file, self.storage.secure_file):
+            path.write_bytes(path.read_bytes()[:-5])
+
+        for n in (3, 4):
+            self.storage.save_session({"n": n}, CLINICAL_CONFIG, TIMESTAMP)
+
+        expected = [{"n": 1}, {"n": 3}, {"n": 4}]
+        history = self.storage.load_history()
+        self.assertEqual([e["result"] for e in history], expected)
+        secure = self.storage.load_secure_history()
+        self.assertEqual([e["result"] for e in secure], expected)
+
+    def test_torn_signature_is_rewritten(self) -> None:
+        self.storage.secure_file.write_bytes(b"NXB")
+
+        self.storage.save_session({"n": 1}, CLINICAL_CONFIG, TIMESTAMP)
+
+        entries = self.storage.load_secure_history()
+        self.assertEqual([e["result"] for e in entries], [{"n": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()